@@ -15,9 +15,15 @@ from __future__ import annotations
 
 import io
 import keyword
-import textwrap
+import re
+import threading
+import time
+import tokenize
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
 from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
 from typing import Callable
 from tkinter import (  # type: ignore[attr-defined]
@@ -29,13 +35,126 @@ from tkinter import (  # type: ignore[attr-defined]
     VERTICAL,
     Y,
     Event,
+    Listbox,
     Menu,
+    TclVersion,
     Text,
     Tk,
     Toplevel,
 )
 from tkinter import filedialog, messagebox, ttk
 
+_STRING_TOKENS = frozenset(
+    getattr(tokenize, name)
+    for name in ("STRING", "FSTRING_START", "FSTRING_MIDDLE", "FSTRING_END")
+    if hasattr(tokenize, name)
+)
+
+_KW_PATTERN = re.compile(r"\b(?:" + "|".join(map(re.escape, keyword.kwlist)) + r")\b")
+_COMMENT_PATTERN = re.compile(r"#[^\n]*")
+_STRING_PATTERN = re.compile(r"'(?:\\.|[^'\\\n])*'|\"(?:\\.|[^\"\\\n])*\"")
+# Fallback for text the tokenizer rejects. Group names double as tag names.
+_SYNTAX_PATTERN = re.compile(
+    f"(?P<keyword>{_KW_PATTERN.pattern})"
+    f"|(?P<comment>{_COMMENT_PATTERN.pattern})"
+    f"|(?P<string>{_STRING_PATTERN.pattern})"
+)
+
+_TIPS_TEXT = (
+    "✨ Productivity Tips\n"
+    "--------------------\n"
+    "• Press Ctrl+Space for autocomplete suggestions.\n"
+    "• Use Shift+F5 to run only the selected portion of code.\n"
+    "• Explore the Examples tab for curated snippets.\n"
+    "• Keep an eye on the helper panel for keyword hints.\n"
+    "• Experiment freely—the console output does not affect your files."
+)
+
+
+def _line_offsets(content: str) -> list[int]:
+    """Return the character offset at which each line of ``content`` starts."""
+    return list(accumulate((len(line) + 1 for line in content.split("\n")), initial=0))
+
+
+# Tcl 8 stores text as UTF-16, so characters outside the BMP (e.g. emoji)
+# occupy two Tk columns while Python counts them as one.
+_UTF16_COLUMNS = TclVersion < 9
+
+
+def _tk_length(text: str) -> int:
+    """Return how many Tk columns ``text`` spans."""
+    if not _UTF16_COLUMNS or text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _py_column(line: str, tk_column: int) -> int:
+    """Convert a Tk column within ``line`` back into a Python string index."""
+    if not _UTF16_COLUMNS or line.isascii():
+        return tk_column
+    units = 0
+    for index, char in enumerate(line):
+        if units >= tk_column:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def _offset_to_index(content: str, line_starts: list[int], offset: int, first_line: int = 1) -> str:
+    """Convert a character offset into ``content`` to a Tk ``line.column`` index.
+
+    ``first_line`` is the buffer line on which the scanned text begins.
+    """
+    line = bisect_right(line_starts, offset)
+    column = _tk_length(content[line_starts[line - 1]:offset])
+    return f"{first_line + line - 1}.{column}"
+
+
+def _token_tag(token: tokenize.TokenInfo) -> str | None:
+    if token.type in _STRING_TOKENS:
+        return "string"
+    if token.type == tokenize.COMMENT:
+        return "comment"
+    if token.type == tokenize.NAME and keyword.iskeyword(token.string):
+        return "keyword"
+    return None
+
+
+def _syntax_ranges(content: str, first_line: int = 1) -> dict[str, list[str]]:
+    """Map each highlight tag to the flat list of Tk index pairs it covers.
+
+    ``content`` is lexed with :mod:`tokenize` so triple-quoted and prefixed
+    strings are coloured correctly.  Code being edited is often incomplete,
+    so whatever follows a tokenizer error is coloured with ``_SYNTAX_PATTERN``.
+    """
+    ranges: defaultdict[str, list[str]] = defaultdict(list)
+    # Token columns only need converting to Tk columns on non-ASCII text.
+    lines = None if content.isascii() else content.split("\n")
+
+    def tk_index(row: int, column: int) -> str:
+        if lines is not None:
+            column = _tk_length(lines[row - 1][:column])
+        return f"{first_line + row - 1}.{column}"
+
+    resume = (1, 0)
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(content).readline):
+            tag = _token_tag(token)
+            if tag:
+                ranges[tag].extend((tk_index(*token.start), tk_index(*token.end)))
+            resume = token.end
+    except (tokenize.TokenError, SyntaxError):
+        line_starts = _line_offsets(content)
+        row = min(resume[0], len(line_starts))
+        for match in _SYNTAX_PATTERN.finditer(content, line_starts[row - 1] + resume[1]):
+            ranges[match.lastgroup].extend(
+                (
+                    _offset_to_index(content, line_starts, match.start(), first_line),
+                    _offset_to_index(content, line_starts, match.end(), first_line),
+                )
+            )
+    return ranges
+
 
 @dataclass
 class QuizQuestion:
@@ -46,6 +165,31 @@ class QuizQuestion:
     explanation: str
 
 
+class _ChunkSink(io.TextIOBase):
+    """Text stream that collects writes in a deque drained by the GUI thread."""
+
+    def __init__(self, chunks: deque[str]) -> None:
+        super().__init__()
+        self.chunks = chunks
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.chunks.append(text)
+        return len(text)
+
+
+def _run_user_code(code: str, chunks: deque[str]) -> None:
+    """Execute ``code`` with its stdout and stderr collected in ``chunks``."""
+    sink = _ChunkSink(chunks)
+    try:
+        with redirect_stdout(sink), redirect_stderr(sink):
+            exec(code, {"__name__": "__main__"}, {})
+    except Exception as exc:
+        chunks.append(f"Error: {exc}\n")
+
+
 class PythonLearningEditor:
     """Interactive text editor with built-in learning helpers.
 
@@ -54,32 +198,38 @@ class PythonLearningEditor:
     through it.
     """
 
-    AUTOCOMPLETE_SUGGESTIONS = sorted(
-        set(keyword.kwlist)
-        | {
-            "print",
-            "input",
-            "range",
-            "len",
-            "enumerate",
-            "list",
-            "dict",
-            "tuple",
-            "set",
-            "int",
-            "float",
-            "str",
-            "open",
-            "with",
-            "for",
-            "while",
-            "def",
-            "class",
-            "import",
-            "from",
-        }
+    # Kept as a sorted tuple so prefix lookups can bisect instead of scanning.
+    AUTOCOMPLETE_SUGGESTIONS = tuple(
+        sorted(
+            set(keyword.kwlist)
+            | {
+                "print",
+                "input",
+                "range",
+                "len",
+                "enumerate",
+                "list",
+                "dict",
+                "tuple",
+                "set",
+                "int",
+                "float",
+                "str",
+                "open",
+                "with",
+                "for",
+                "while",
+                "def",
+                "class",
+                "import",
+                "from",
+            }
+        )
     )
 
+    # Suggestions beyond this count are added to the popup once Tk is idle.
+    MAX_VISIBLE_SUGGESTIONS = 20
+
     KEYWORD_HELP = {
         "for": "Iterate over items in a sequence. Syntax: for item in sequence:",
         "while": "Repeat a block while a condition remains True.",
@@ -92,52 +242,58 @@ class PythonLearningEditor:
         "dict": "Mapping of keys to values. Literal syntax uses {key: value}.",
     }
 
-    CHEAT_SHEET = textwrap.dedent(
-        """
-        🐍 Python Cheat Sheet
-        --------------------
-        • print(value, ...): display output.
-        • input(prompt): ask the user for data.
-        • for item in sequence: iterate over items.
-        • if condition: create decision branches.
-        • list comprehensions: [expr for item in iterable].
-        • with open('file.txt') as handle: manage file resources safely.
-        • Modules are imported with `import math` or `from math import sqrt`.
-        • Virtual environments keep project dependencies isolated.
-        • Use `help(object)` in the console for built-in documentation.
-        """
-    ).strip()
+    CHEAT_SHEET = (
+        "🐍 Python Cheat Sheet\n"
+        "--------------------\n"
+        "• print(value, ...): display output.\n"
+        "• input(prompt): ask the user for data.\n"
+        "• for item in sequence: iterate over items.\n"
+        "• if condition: create decision branches.\n"
+        "• list comprehensions: [expr for item in iterable].\n"
+        "• with open('file.txt') as handle: manage file resources safely.\n"
+        "• Modules are imported with `import math` or `from math import sqrt`.\n"
+        "• Virtual environments keep project dependencies isolated.\n"
+        "• Use `help(object)` in the console for built-in documentation."
+    )
 
     CODE_EXAMPLES = {
         "Hello": "print('Hello, Python adventurer!')",
-        "FizzBuzz": textwrap.dedent(
-            """
-            for number in range(1, 21):
-                if number % 15 == 0:
-                    print('FizzBuzz')
-                elif number % 3 == 0:
-                    print('Fizz')
-                elif number % 5 == 0:
-                    print('Buzz')
-                else:
-                    print(number)
-            """
-        ).strip(),
-        "Guess": textwrap.dedent(
-            """
-            import random
-
-            secret = random.randint(1, 10)
-            while True:
-                guess = int(input('Guess between 1 and 10: '))
-                if guess == secret:
-                    print('You guessed it!')
-                    break
-                print('Too high!' if guess > secret else 'Too low!')
-            """
-        ).strip(),
+        "FizzBuzz": (
+            "for number in range(1, 21):\n"
+            "    if number % 15 == 0:\n"
+            "        print('FizzBuzz')\n"
+            "    elif number % 3 == 0:\n"
+            "        print('Fizz')\n"
+            "    elif number % 5 == 0:\n"
+            "        print('Buzz')\n"
+            "    else:\n"
+            "        print(number)"
+        ),
+        "Guess": (
+            "import random\n"
+            "\n"
+            "secret = random.randint(1, 10)\n"
+            "while True:\n"
+            "    guess = int(input('Guess between 1 and 10: '))\n"
+            "    if guess == secret:\n"
+            "        print('You guessed it!')\n"
+            "        break\n"
+            "    print('Too high!' if guess > secret else 'Too low!')"
+        ),
     }
 
+    SYNTAX_TAGS = ("keyword", "string", "comment")
+
+    # Dirty ranges spanning more lines than this are re-highlighted in full.
+    FULL_RESCAN_LINES = 200
+    # Highlighting waits until no key has been released for this long.
+    TYPING_PAUSE_SECONDS = 0.08
+    # Output queued beyond this many characters is dropped from the oldest
+    # end before it reaches the console, so only the tail is ever inserted.
+    MAX_CONSOLE_BACKLOG_CHARS = 500_000
+    # Oldest console lines are trimmed so the widget never grows past this.
+    MAX_CONSOLE_LINES = 5000
+
     QUIZ_QUESTIONS = (
         QuizQuestion(
             prompt="What keyword starts a function definition?",
@@ -162,13 +318,26 @@ class PythonLearningEditor:
         self.root.geometry("1200x720")
 
         self.file_path: Path | None = None
+        self._unsaved = False
+        self._scroll_after: str | None = None
+        self._scroll_fraction = ("0.0", "1.0")
         self._build_layout()
         self._create_menus()
         self._bind_events()
 
         self._after_id: str | None = None
-        self._autocomplete_window: Toplevel | None = None
-        self._autocomplete_list: ttk.Treeview | None = None
+        self._worker: threading.Thread | None = None
+        self._has_dirty_range = False
+        self._known_line_count = 1
+        self._last_keystroke = 0.0
+        self._buffer_text: str | None = None
+        self._line_starts: list[int] = []
+        self._helper_description: str | None = None
+        self._last_line_count = 0
+        self._status_after: str | None = None
+        self._last_status_text = ""
+        self._autocomplete_after: str | None = None
+        self._build_autocomplete_popup()
 
     # ------------------------------------------------------------------ GUI --
     def _build_layout(self) -> None:
@@ -181,8 +350,8 @@ class PythonLearningEditor:
         editor_frame = ttk.Frame(top_panel)
         top_panel.add(editor_frame, weight=3)
 
-        text_scrollbar = ttk.Scrollbar(editor_frame)
-        text_scrollbar.pack(side=RIGHT, fill=Y)
+        self.text_scrollbar = ttk.Scrollbar(editor_frame)
+        self.text_scrollbar.pack(side=RIGHT, fill=Y)
 
         self.line_numbers = Text(
             editor_frame,
@@ -202,8 +371,18 @@ class PythonLearningEditor:
             font=("Consolas", 12),
         )
         self.text.pack(fill=BOTH, expand=True)
-        self.text.config(yscrollcommand=lambda first, last: self._on_text_scroll(text_scrollbar, first, last))
-        text_scrollbar.config(command=self._sync_scroll)
+        self.text.tag_configure("keyword", foreground="#005cc5", font=("Consolas", 12, "bold"))
+        self.text.tag_configure("string", foreground="#a31515")
+        self.text.tag_configure("comment", foreground="#008000")
+        # Bounds of the text awaiting re-highlighting. Marks move with edits
+        # made elsewhere, and the gravities keep text typed at either edge
+        # inside the range.
+        self.text.mark_set("dirty_lo", "1.0")
+        self.text.mark_gravity("dirty_lo", "left")
+        self.text.mark_set("dirty_hi", "1.0")
+        self.text.mark_gravity("dirty_hi", "right")
+        self.text.config(yscrollcommand=self._on_text_scroll)
+        self.text_scrollbar.config(command=self.text.yview)
 
         helper_notebook = ttk.Notebook(top_panel, width=320)
         top_panel.add(helper_notebook, weight=1)
@@ -211,30 +390,18 @@ class PythonLearningEditor:
         self.helper_text = Text(helper_notebook, wrap="word", state="disabled")
         helper_notebook.add(self.helper_text, text="Helper")
 
-        cheat_sheet = Text(helper_notebook, wrap="word", state="normal")
-        cheat_sheet.insert("1.0", self.CHEAT_SHEET)
-        cheat_sheet.config(state="disabled")
-        helper_notebook.add(cheat_sheet, text="Cheat Sheet")
-
-        examples_frame = ttk.Frame(helper_notebook)
-        helper_notebook.add(examples_frame, text="Examples")
-        self.example_list = ttk.Treeview(examples_frame, show="tree")
-        self.example_list.pack(fill=BOTH, expand=True)
-        for label in sorted(self.CODE_EXAMPLES):
-            self.example_list.insert("", END, iid=label, text=label)
-
-        quiz_frame = ttk.Frame(helper_notebook)
-        helper_notebook.add(quiz_frame, text="Quiz")
-        self.quiz_prompt = ttk.Label(quiz_frame, wraplength=260, justify=LEFT)
-        self.quiz_prompt.pack(padx=8, pady=8, anchor='w')
-        self.quiz_entry = ttk.Entry(quiz_frame)
-        self.quiz_entry.pack(fill='x', padx=8)
-        self.quiz_feedback = ttk.Label(quiz_frame, foreground="blue", wraplength=260)
-        self.quiz_feedback.pack(padx=8, pady=(4, 8), anchor='w')
-        self.quiz_button = ttk.Button(quiz_frame, text="Check", command=self._check_quiz)
-        self.quiz_button.pack(padx=8, pady=(0, 8), anchor='e')
+        # The remaining tabs start empty and are filled on first selection.
+        self._lazy_tabs: dict[str, Callable[[ttk.Frame], None]] = {}
+        for label, builder in (
+            ("Cheat Sheet", self._build_cheat_sheet_tab),
+            ("Examples", self._build_examples_tab),
+            ("Quiz", self._build_quiz_tab),
+        ):
+            frame = ttk.Frame(helper_notebook)
+            helper_notebook.add(frame, text=label)
+            self._lazy_tabs[str(frame)] = builder
+        helper_notebook.bind("<<NotebookTabChanged>>", self._on_helper_tab_changed)
         self._quiz_index = 0
-        self._show_quiz_question()
 
         console_frame = ttk.Frame(container)
         container.add(console_frame, weight=1)
@@ -247,6 +414,42 @@ class PythonLearningEditor:
         self.status = ttk.Label(self.root, text="Ready", anchor='w')
         self.status.pack(fill='x', side=TOP)
 
+    def _on_helper_tab_changed(self, event: Event) -> None:
+        notebook = event.widget
+        builder = self._lazy_tabs.pop(notebook.select(), None)
+        if builder:
+            builder(notebook.nametowidget(notebook.select()))
+
+    def _build_cheat_sheet_tab(self, frame: ttk.Frame) -> None:
+        cheat_sheet = Text(frame, wrap="word", state="normal")
+        cheat_sheet.insert("1.0", self.CHEAT_SHEET)
+        cheat_sheet.config(state="disabled")
+        cheat_sheet.pack(fill=BOTH, expand=True)
+
+    def _build_examples_tab(self, frame: ttk.Frame) -> None:
+        self.example_list = ttk.Treeview(frame, show="tree")
+        self.example_list.pack(fill=BOTH, expand=True)
+        # One Tcl round-trip for all rows; passing the labels as a list
+        # object lets Tcl handle any quoting they need.
+        self.example_list.tk.call(
+            "foreach",
+            "label",
+            tuple(sorted(self.CODE_EXAMPLES)),
+            f"{self.example_list} insert {{}} end -id $label -text $label",
+        )
+        self.example_list.bind("<<TreeviewSelect>>", self._insert_example)
+
+    def _build_quiz_tab(self, frame: ttk.Frame) -> None:
+        self.quiz_prompt = ttk.Label(frame, wraplength=260, justify=LEFT)
+        self.quiz_prompt.pack(padx=8, pady=8, anchor='w')
+        self.quiz_entry = ttk.Entry(frame)
+        self.quiz_entry.pack(fill='x', padx=8)
+        self.quiz_feedback = ttk.Label(frame, foreground="blue", wraplength=260)
+        self.quiz_feedback.pack(padx=8, pady=(4, 8), anchor='w')
+        self.quiz_button = ttk.Button(frame, text="Check", command=self._check_quiz)
+        self.quiz_button.pack(padx=8, pady=(0, 8), anchor='e')
+        self._show_quiz_question()
+
     def _create_menus(self) -> None:
         menubar = Menu(self.root)
 
@@ -280,12 +483,11 @@ class PythonLearningEditor:
         self.root.config(menu=menubar)
 
     def _bind_events(self) -> None:
-        self.text.bind("<KeyRelease>", self._on_text_change)
-        self.text.bind("<ButtonRelease>", self._update_helper_panel)
+        self.text.bind("<KeyRelease>", self._on_key_release)
+        self.text.bind("<<Modified>>", self._on_modified)
+        self.text.bind("<ButtonRelease>", self._on_cursor_moved)
+        self.text.bind("<<Selection>>", self._on_cursor_moved)
         self.text.bind("<Control-space>", self._show_autocomplete)
-        self.text.bind("<Motion>", self._update_status_bar)
-        self.text.bind("<KeyRelease>", self._update_status_bar, add="+")
-        self.text.bind("<<Selection>>", self._update_helper_panel)
         self.text.bind("<F5>", lambda event: self._run_event(self.run_code))
         self.text.bind("<Shift-F5>", lambda event: self._run_event(self.run_selection))
         self.text.bind("<Control-n>", lambda event: self._run_event(self.new_file))
@@ -293,24 +495,60 @@ class PythonLearningEditor:
         self.text.bind("<Control-s>", lambda event: self._run_event(self.save_file))
         self.text.bind("<Control-f>", lambda event: self._run_event(self._open_find_dialog))
 
-        self.example_list.bind("<<TreeviewSelect>>", self._insert_example)
-
     # ---------------------------------------------------------- Event helpers --
     def _run_event(self, action: Callable[[], None]) -> str:
         action()
         return "break"
 
-    def _on_text_change(self, event: Event | None = None) -> None:
+    def _on_key_release(self, event: Event | None = None) -> None:
+        self._last_keystroke = time.monotonic()
         self._update_line_numbers()
+        self._on_cursor_moved()
+
+    def _on_cursor_moved(self, event: Event | None = None) -> None:
         self._update_helper_panel()
-        if self._after_id:
-            self.root.after_cancel(self._after_id)
-        self._after_id = self.root.after(200, self._highlight_syntax)
+        self._schedule_status_bar()
+
+    def _on_modified(self, event: Event | None = None) -> None:
+        self._buffer_text = None
+        # Resetting the flag below fires <<Modified>> again; ignore that echo.
+        if not self.text.edit_modified():
+            return
+        self._unsaved = True
+        line = int(self.text.index("insert linestart").split(".")[0])
+        lines = int(self.text.index("end-1c").split(".")[0])
+        # A multi-line paste leaves the cursor on its last line, so widen the
+        # range upwards by however many lines were added.
+        added = max(lines - self._known_line_count, 0)
+        self._known_line_count = lines
+        self._mark_dirty(max(line - added, 1), line)
+        self.text.edit_modified(False)
+        self._schedule_highlight()
+
+    def _mark_dirty(self, lo: int, hi: int) -> None:
+        start, end = f"{lo}.0", f"{hi}.end"
+        if self._has_dirty_range:
+            if self.text.compare("dirty_lo", "<", start):
+                start = "dirty_lo"
+            if self.text.compare("dirty_hi", ">", end):
+                end = "dirty_hi"
+        self.text.mark_set("dirty_lo", start)
+        self.text.mark_set("dirty_hi", end)
+        self._has_dirty_range = True
+
+    def _schedule_status_bar(self, event: Event | None = None) -> None:
+        if self._status_after:
+            self.root.after_cancel(self._status_after)
+        self._status_after = self.root.after(50, self._update_status_bar)
 
     def _update_status_bar(self, event: Event | None = None) -> None:
+        self._status_after = None
         line, column = self._cursor_position()
         filename = self.file_path.name if self.file_path else "Untitled"
-        self.status.config(text=f"{filename} — line {line}, column {column}")
+        text = f"{filename} — line {line}, column {column}"
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status.config(text=text)
 
     def _cursor_position(self) -> tuple[int, int]:
         index = self.text.index("insert").split(".")
@@ -319,70 +557,99 @@ class PythonLearningEditor:
     # ----------------------------------------------------------- Line numbers --
     def _update_line_numbers(self) -> None:
         lines = int(self.text.index("end-1c").split(".")[0])
-        content = "\n".join(str(number) for number in range(1, lines + 1))
+        previous = self._last_line_count
+        if lines == previous:
+            return
         self.line_numbers.config(state="normal")
-        self.line_numbers.delete("1.0", END)
-        self.line_numbers.insert("1.0", content)
+        if lines > previous:
+            added = "\n".join(map(str, range(previous + 1, lines + 1)))
+            self.line_numbers.insert(END, f"\n{added}" if previous else added)
+        else:
+            self.line_numbers.delete(f"{lines}.end", END)
         self.line_numbers.config(state="disabled")
-
-    def _sync_scroll(self, *args: str) -> None:
-        self.text.yview(*args)
-        self.line_numbers.yview(*args)
-
-    def _on_text_scroll(self, scrollbar: ttk.Scrollbar, first: str, last: str) -> None:
-        scrollbar.set(first, last)
+        self._last_line_count = lines
+
+    def _on_text_scroll(self, first: str, last: str) -> None:
+        # Mouse-wheel bursts report many positions; sync only the latest once idle.
+        self._scroll_fraction = (first, last)
+        if self._scroll_after is None:
+            self._scroll_after = self.root.after_idle(self._apply_scroll)
+
+    def _apply_scroll(self) -> None:
+        self._scroll_after = None
+        first, last = self._scroll_fraction
+        self.text_scrollbar.set(first, last)
         self.line_numbers.yview_moveto(first)
 
     # ----------------------------------------------------------- Syntax colour --
-    def _highlight_syntax(self) -> None:
+    def _schedule_highlight(self) -> None:
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(100, self._highlight_when_idle)
+
+    def _highlight_when_idle(self) -> None:
+        self._after_id = self.root.after_idle(self._highlight_dirty_lines)
+
+    def _highlight_dirty_lines(self) -> None:
+        if time.monotonic() - self._last_keystroke < self.TYPING_PAUSE_SECONDS:
+            self._schedule_highlight()
+            return
+        if not self._has_dirty_range:
+            self._after_id = None
+            return
+        lo = int(self.text.index("dirty_lo").split(".")[0])
+        hi = int(self.text.index("dirty_hi").split(".")[0])
+        if hi - lo > self.FULL_RESCAN_LINES:
+            self._highlight_syntax()
+        else:
+            self._highlight_syntax(lo, hi)
+
+    def _highlight_syntax(self, lo: int | None = None, hi: int | None = None) -> None:
+        """Re-colour lines ``lo`` to ``hi`` inclusive, or the whole buffer."""
         self._after_id = None
-        keyword_tag = "keyword"
-        string_tag = "string"
-        comment_tag = "comment"
-        for tag in (keyword_tag, string_tag, comment_tag):
-            self.text.tag_delete(tag)
-        self.text.tag_configure(keyword_tag, foreground="#005cc5", font=("Consolas", 12, "bold"))
-        self.text.tag_configure(string_tag, foreground="#a31515")
-        self.text.tag_configure(comment_tag, foreground="#008000")
-
-        content = self.text.get("1.0", "end-1c")
-        for kw in keyword.kwlist:
-            start = "1.0"
-            while True:
-                start = self.text.search(rf"\m{kw}\M", start, stopindex=END, regexp=True)
-                if not start:
-                    break
-                end = f"{start}+{len(kw)}c"
-                self.text.tag_add(keyword_tag, start, end)
-                start = end
-
-        start = "1.0"
-        while True:
-            start = self.text.search(r"(#.*)$", start, stopindex=END, regexp=True)
-            if not start:
-                break
-            line_end = f"{start.split('.')[0]}.end"
-            self.text.tag_add(comment_tag, start, line_end)
-            start = line_end
-
-        start = "1.0"
-        while True:
-            start = self.text.search(r"(['\"])(?:(?=(\\?))\2.)*?\1", start, stopindex=END, regexp=True)
-            if not start:
-                break
-            end_index = self.text.index(f"{start}+1c")
-            quote = self.text.get(start, end_index)
-            end = self.text.search(quote, f"{start}+1c", regexp=False, stopindex=END)
-            if not end:
-                break
-            end = self.text.index(f"{end}+1c")
-            self.text.tag_add(string_tag, start, end)
-            start = end
+        self._has_dirty_range = False
+        last_line = int(self.text.index("end-1c").split(".")[0])
+        if lo is None or hi is None:
+            lo, hi = 1, last_line
+        else:
+            lo, hi = max(lo, 1), min(hi, last_line)
+        content = self.text.get(f"{lo}.0", f"{hi}.end")
+        if (lo, hi) != (1, last_line):
+            # Slices are lexed on their own, so a triple quote in the edit can
+            # change every line below it; anything less re-lexes whole strings.
+            if '"""' in content or "'''" in content:
+                bounds = (1, last_line)
+            else:
+                bounds = self._widen_to_strings(lo, hi)
+            if bounds != (lo, hi):
+                lo, hi = bounds
+                content = self.text.get(f"{lo}.0", f"{hi}.end")
+        if (lo, hi) == (1, last_line):
+            self._known_line_count = last_line
+
+        start, end = f"{lo}.0", f"{hi}.end"
+        for tag in self.SYNTAX_TAGS:
+            self.text.tag_remove(tag, start, end)
+        for tag, indices in _syntax_ranges(content, lo).items():
+            self.text.tag_add(tag, *indices)
+
+    def _widen_to_strings(self, lo: int, hi: int) -> tuple[int, int]:
+        """Grow lines ``lo`` to ``hi`` so that no ``string`` range crosses either edge."""
+        before = self.text.tag_prevrange("string", f"{lo}.0")
+        if before and self.text.compare(before[1], ">", f"{lo}.0"):
+            lo = int(str(before[0]).split(".")[0])
+        after = self.text.tag_prevrange("string", f"{hi}.end")
+        if after and self.text.compare(after[1], ">", f"{hi}.end"):
+            hi = int(str(after[1]).split(".")[0])
+        return lo, hi
 
     # --------------------------------------------------------- Helper panels --
     def _update_helper_panel(self, event: Event | None = None) -> None:
         word = self._current_word()
         description = self.KEYWORD_HELP.get(word, "Select a keyword to see a tip.")
+        if description == self._helper_description:
+            return
+        self._helper_description = description
         self.helper_text.config(state="normal")
         self.helper_text.delete("1.0", END)
         self.helper_text.insert("1.0", description)
@@ -405,10 +672,7 @@ class PythonLearningEditor:
         code = self.CODE_EXAMPLES.get(selection[0])
         if not code:
             return
-        self.text.delete("1.0", END)
-        self.text.insert("1.0", code)
-        self._update_line_numbers()
-        self._highlight_syntax()
+        self._replace_buffer(code, unsaved=True)
 
     # -------------------------------------------------------------- Quiz app --
     def _show_quiz_question(self) -> None:
@@ -428,12 +692,28 @@ class PythonLearningEditor:
         self.root.after(2000, self._show_quiz_question)
 
     # -------------------------------------------------------------- Autocomplete --
+    def _build_autocomplete_popup(self) -> None:
+        # Created once and shown/hidden on demand; building a Toplevel per
+        # Ctrl+Space is far more expensive than refilling its Listbox.
+        window = Toplevel(self.root)
+        window.withdraw()
+        window.wm_overrideredirect(True)
+        listbox = Listbox(window, font=("Consolas", 11), activestyle="none", exportselection=False)
+        listbox.pack(fill=BOTH, expand=True)
+        listbox.bind("<Double-1>", lambda e: self._insert_autocomplete())
+        listbox.bind("<Return>", lambda e: self._insert_autocomplete())
+        listbox.bind("<Escape>", lambda e: self._close_autocomplete())
+        self._autocomplete_window = window
+        self._autocomplete_list = listbox
+
     def _show_autocomplete(self, event: Event | None = None) -> str:
-        if self._autocomplete_window:
-            self._autocomplete_window.destroy()
+        self._close_autocomplete()
 
         word = self._current_word()
-        matches = [item for item in self.AUTOCOMPLETE_SUGGESTIONS if item.startswith(word)]
+        suggestions = self.AUTOCOMPLETE_SUGGESTIONS
+        lo = bisect_left(suggestions, word)
+        hi = bisect_left(suggestions, word + "\uffff", lo)
+        matches = suggestions[lo:hi]
         if not matches:
             return "break"
 
@@ -444,37 +724,40 @@ class PythonLearningEditor:
         x += self.text.winfo_rootx()
         y += self.text.winfo_rooty() + height
 
-        window = Toplevel(self.root)
-        window.wm_overrideredirect(True)
-        window.geometry(f"200x200+{x}+{y}")
-        self._autocomplete_window = window
+        listbox = self._autocomplete_list
+        listbox.delete(0, END)
+        visible = self.MAX_VISIBLE_SUGGESTIONS
+        listbox.insert(END, *matches[:visible])
+        if len(matches) > visible:
+            self._autocomplete_after = self.root.after_idle(self._append_autocomplete, matches[visible:])
+        listbox.selection_set(0)
+        listbox.activate(0)
 
-        tree = ttk.Treeview(window, show="tree")
-        tree.pack(fill=BOTH, expand=True)
-        for item in matches:
-            tree.insert("", END, iid=item, text=item)
-        tree.focus(matches[0])
-        tree.selection_set(matches[0])
-        tree.bind("<Double-1>", lambda e: self._insert_autocomplete(tree))
-        tree.bind("<Return>", lambda e: self._insert_autocomplete(tree))
-        tree.bind("<Escape>", lambda e: self._close_autocomplete())
-        tree.focus_set()
-        self._autocomplete_list = tree
+        window = self._autocomplete_window
+        window.geometry(f"200x200+{x}+{y}")
+        window.deiconify()
+        listbox.focus_set()
         return "break"
 
-    def _insert_autocomplete(self, tree: ttk.Treeview) -> None:
-        selection = tree.selection()
+    def _append_autocomplete(self, items: tuple[str, ...]) -> None:
+        self._autocomplete_after = None
+        self._autocomplete_list.insert(END, *items)
+
+    def _insert_autocomplete(self) -> None:
+        selection = self._autocomplete_list.curselection()
         if not selection:
             return
-        word = selection[0]
+        word = self._autocomplete_list.get(selection[0])
         self._replace_current_word(word)
         self._close_autocomplete()
 
     def _close_autocomplete(self) -> None:
-        if self._autocomplete_window:
-            self._autocomplete_window.destroy()
-            self._autocomplete_window = None
-        self._autocomplete_list = None
+        if self._autocomplete_after:
+            self.root.after_cancel(self._autocomplete_after)
+            self._autocomplete_after = None
+        if self._autocomplete_window.winfo_ismapped():
+            self._autocomplete_window.withdraw()
+            self.text.focus_set()
 
     def _replace_current_word(self, replacement: str) -> None:
         if self.text.tag_ranges("sel"):
@@ -489,12 +772,26 @@ class PythonLearningEditor:
             self.text.insert(start, replacement)
 
     # --------------------------------------------------------------- File ops --
+    def _replace_buffer(self, content: str, *, unsaved: bool) -> None:
+        """Swap in ``content`` and refresh the gutter and colours right away.
+
+        The modified flag is cleared before Tk delivers the queued
+        ``<<Modified>>`` event, so ``_on_modified`` treats it as an echo and
+        does not schedule a second highlight pass for this edit.
+        """
+        self.text.delete("1.0", END)
+        if content:
+            self.text.insert("1.0", content)
+        self.text.edit_modified(False)
+        self._unsaved = unsaved
+        self._update_line_numbers()
+        self._highlight_syntax()
+
     def new_file(self) -> None:
         if self._confirm_unsaved_changes():
-            self.text.delete("1.0", END)
+            self._replace_buffer("", unsaved=False)
             self.file_path = None
-            self.status.config(text="Untitled — line 1, column 1")
-            self.text.edit_modified(False)
+            self._update_status_bar()
 
     def open_file(self) -> None:
         if not self._confirm_unsaved_changes():
@@ -502,13 +799,9 @@ class PythonLearningEditor:
         filename = filedialog.askopenfilename(filetypes=[("Python files", "*.py"), ("All files", "*.*")])
         if filename:
             path = Path(filename)
-            self.text.delete("1.0", END)
-            self.text.insert("1.0", path.read_text(encoding="utf8"))
+            self._replace_buffer(path.read_text(encoding="utf8"), unsaved=False)
             self.file_path = path
-            self._update_line_numbers()
-            self._highlight_syntax()
             self._update_status_bar()
-            self.text.edit_modified(False)
 
     def save_file(self) -> None:
         if self.file_path is None:
@@ -517,6 +810,7 @@ class PythonLearningEditor:
         self.file_path.write_text(self.text.get("1.0", "end-1c"), encoding="utf8")
         messagebox.showinfo("Saved", f"Saved to {self.file_path}")
         self.text.edit_modified(False)
+        self._unsaved = False
 
     def save_file_as(self) -> None:
         filename = filedialog.asksaveasfilename(defaultextension=".py", filetypes=[("Python files", "*.py")])
@@ -525,7 +819,7 @@ class PythonLearningEditor:
             self.save_file()
 
     def _confirm_unsaved_changes(self) -> bool:
-        if not self.text.edit_modified():
+        if not self._unsaved:
             return True
 
         answer = messagebox.askyesnocancel(
@@ -535,10 +829,11 @@ class PythonLearningEditor:
             return False
         if answer:
             self.save_file()
-            if self.text.edit_modified():
+            if self._unsaved:
                 return False
         else:
             self.text.edit_modified(False)
+            self._unsaved = False
         return True
 
     def _undo(self) -> None:
@@ -553,6 +848,16 @@ class PythonLearningEditor:
         except Exception:
             pass
 
+    def _buffer_snapshot(self) -> tuple[str, list[int]]:
+        """Return the editor text and its line start offsets.
+
+        Both are cached until the next ``<<Modified>>`` event.
+        """
+        if self._buffer_text is None:
+            self._buffer_text = self.text.get("1.0", "end-1c")
+            self._line_starts = _line_offsets(self._buffer_text)
+        return self._buffer_text, self._line_starts
+
     def _open_find_dialog(self) -> None:
         dialog = Toplevel(self.root)
         dialog.title("Find text")
@@ -566,9 +871,14 @@ class PythonLearningEditor:
             needle = entry.get()
             if not needle:
                 return
-            start = self.text.search(needle, self.text.index("insert"), stopindex=END)
-            if start:
-                end = f"{start}+{len(needle)}c"
+            content, line_starts = self._buffer_snapshot()
+            line, column = map(int, self.text.index("insert").split("."))
+            line_start = line_starts[line - 1]
+            column = _py_column(content[line_start:line_starts[line] - 1], column)
+            offset = content.find(needle, line_start + column)
+            if offset != -1:
+                start = _offset_to_index(content, line_starts, offset)
+                end = _offset_to_index(content, line_starts, offset + len(needle))
                 self.text.tag_remove("sel", "1.0", END)
                 self.text.tag_add("sel", start, end)
                 self.text.mark_set("insert", end)
@@ -595,39 +905,59 @@ class PythonLearningEditor:
         self._execute_code(code)
 
     def _execute_code(self, code: str) -> None:
-        console_output = io.StringIO()
-        console_error = io.StringIO()
-        local_env: dict[str, object] = {}
-        try:
-            with redirect_stdout(console_output), redirect_stderr(console_error):
-                exec(code, {"__name__": "__main__"}, local_env)
-        except Exception as exc:
-            console_error.write(f"Error: {exc}\n")
-        finally:
-            output = console_output.getvalue()
-            errors = console_error.getvalue()
+        if self._worker and self._worker.is_alive():
+            messagebox.showinfo("Script running", "Wait for the current script to finish.")
+            return
+        chunks: deque[str] = deque()
+        self._worker = threading.Thread(target=_run_user_code, args=(code, chunks), daemon=True)
+        self._worker.start()
+        self.root.after(50, self._drain_console, self._worker, chunks)
+
+    def _drain_console(self, worker: threading.Thread, chunks: deque[str]) -> None:
+        # Checked before draining so output written just before exit is kept.
+        running = worker.is_alive()
+        text = self._newest_console_output([chunks.popleft() for _ in range(len(chunks))])
+        if text:
             self.console.config(state="normal")
-            if output:
-                self.console.insert(END, output)
-            if errors:
-                self.console.insert(END, errors)
+            self.console.insert(END, text)
+            lines = int(self.console.index("end-1c").split(".")[0])
+            if lines > self.MAX_CONSOLE_LINES:
+                self.console.delete("1.0", f"{lines - self.MAX_CONSOLE_LINES + 1}.0")
             self.console.see(END)
             self.console.config(state="disabled")
+        if running or chunks:
+            self.root.after(50, self._drain_console, worker, chunks)
+
+    def _newest_console_output(self, batch: list[str]) -> str:
+        """Join the tail of ``batch`` that the console would keep.
+
+        At most ``MAX_CONSOLE_BACKLOG_CHARS`` characters and
+        ``MAX_CONSOLE_LINES`` lines survive, preceded by a note saying how
+        much older output was skipped.
+        """
+        limit = self.MAX_CONSOLE_BACKLOG_CHARS
+        first = len(batch)
+        kept = 0
+        while first and kept < limit:
+            first -= 1
+            kept += len(batch[first])
+        skipped = sum(map(len, batch[:first]))
+        text = "".join(batch[first:])
+        if len(text) > limit:
+            skipped += len(text) - limit
+            text = text[-limit:]
+        lines = text.split("\n")
+        if len(lines) > self.MAX_CONSOLE_LINES:
+            tail = "\n".join(lines[-self.MAX_CONSOLE_LINES:])
+            skipped += len(text) - len(tail)
+            text = tail
+        if skipped:
+            text = f"\n[... {skipped} characters of output skipped ...]\n{text}"
+        return text
 
     # --------------------------------------------------------------- Help menu --
     def _show_tips(self) -> None:
-        tips = textwrap.dedent(
-            """
-            ✨ Productivity Tips
-            --------------------
-            • Press Ctrl+Space for autocomplete suggestions.
-            • Use Shift+F5 to run only the selected portion of code.
-            • Explore the Examples tab for curated snippets.
-            • Keep an eye on the helper panel for keyword hints.
-            • Experiment freely—the console output does not affect your files.
-            """
-        ).strip()
-        messagebox.showinfo("Python Tips", tips)
+        messagebox.showinfo("Python Tips", _TIPS_TEXT)
 
     def _show_about(self) -> None:
         messagebox.showinfo(
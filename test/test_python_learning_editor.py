@@ -0,0 +1,84 @@
+import types
+
+import pytest
+
+from scripts import python_learning_editor as editor
+
+
+@pytest.fixture
+def utf16_columns(monkeypatch):
+    # Tcl 8 counts characters outside the BMP as two columns.
+    monkeypatch.setattr(editor, "_UTF16_COLUMNS", True)
+
+
+def test_line_offsets():
+    assert editor._line_offsets("ab\n\ncd")[:3] == [0, 3, 4]
+
+
+def test_offset_to_index_first_line():
+    content = "x = 1\ny = 2"
+    line_starts = editor._line_offsets(content)
+    assert editor._offset_to_index(content, line_starts, content.index("y")) == "2.0"
+    assert editor._offset_to_index(content, line_starts, content.index("y"), first_line=10) == "11.0"
+
+
+def test_find_mapping_non_bmp(utf16_columns):
+    content = 'x\nprint("🐍 hi")'
+    line_starts = editor._line_offsets(content)
+    offset = content.find("hi")
+    assert editor._offset_to_index(content, line_starts, offset) == "2.10"
+    assert editor._offset_to_index(content, line_starts, offset + 2) == "2.12"
+
+    line = 'print("🐍 hi")'
+    for column in range(len(line) + 1):
+        assert editor._py_column(line, editor._tk_length(line[:column])) == column
+
+
+def test_syntax_ranges_triple_quoted_string():
+    ranges = editor._syntax_ranges('s = """abc\nfor\n"""\nif s: pass')
+    assert ranges["string"] == ["1.4", "3.3"]
+    assert ranges["keyword"] == ["4.0", "4.2", "4.6", "4.10"]
+
+
+def test_syntax_ranges_tokenizer_error_fallback():
+    # The unterminated triple quote makes tokenize fail; the regex colours the rest.
+    ranges = editor._syntax_ranges('x = "a" # c\ns = """abc\nfor')
+    assert ranges["string"][:2] == ["1.4", "1.7"]
+    assert ranges["comment"] == ["1.8", "1.11"]
+    assert ["3.0", "3.3"] == ranges["keyword"][-2:]
+
+
+def test_syntax_ranges_first_line():
+    ranges = editor._syntax_ranges("for x in 'y':", first_line=5)
+    assert ranges["keyword"] == ["5.0", "5.3", "5.6", "5.8"]
+    assert ranges["string"] == ["5.9", "5.12"]
+
+
+def test_syntax_ranges_non_bmp(utf16_columns):
+    ranges = editor._syntax_ranges('print("🐍") # ok')
+    assert ranges["string"] == ["1.6", "1.10"]
+    assert ranges["comment"] == ["1.12", "1.16"]
+
+
+def make_console_limits(chars, lines):
+    return types.SimpleNamespace(MAX_CONSOLE_BACKLOG_CHARS=chars, MAX_CONSOLE_LINES=lines)
+
+
+def test_newest_console_output_keeps_everything_small():
+    limits = make_console_limits(100, 10)
+    assert editor.PythonLearningEditor._newest_console_output(limits, ["a", "\n"]) == "a\n"
+
+
+def test_newest_console_output_keeps_newest_chars():
+    limits = make_console_limits(100, 1000)
+    text = editor.PythonLearningEditor._newest_console_output(limits, ["a" * 500, "b" * 60, "Error: boom\n"])
+    assert text.endswith("b" * 60 + "Error: boom\n")
+    assert "[... 472 characters of output skipped ...]" in text
+
+
+def test_newest_console_output_keeps_newest_lines():
+    limits = make_console_limits(10_000, 3)
+    chunks = ["\n".join(map(str, range(100))), "\nError: boom\n"]
+    text = editor.PythonLearningEditor._newest_console_output(limits, chunks)
+    assert text.endswith("\n99\nError: boom\n")
+    assert "characters of output skipped" in text